@@ -362,7 +362,7 @@ async def stripe_webhook(request: Request, db: Session = Depends(get_db)):
             )
         else:
             logger.debug(
-                f"Skipping event logging for {event['type']} - no user association"
+                "Skipping event logging for %s - no user association", event["type"]
             )
     except Exception as e:
         logger.error(f"Failed to log webhook event {event['id']}: {e}")
@@ -1,11 +1,6 @@
-import sys
-from pathlib import Path
 from uuid import UUID
 from datetime import datetime, timedelta
 
-# Add parent directory to path to import shared module
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from shared.database.models import User
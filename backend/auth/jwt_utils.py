@@ -1,12 +1,7 @@
 import hashlib
-import sys
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 from typing import Any
 
-# Add parent directory to path to import shared module
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from jose import JWTError, jwt
 from shared.config.settings import settings
 
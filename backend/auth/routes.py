@@ -1,10 +1,5 @@
 import logging
-import sys
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
-
-# Add parent directory to path to import shared module
-sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
@@ -1,9 +1,3 @@
-import sys
-from pathlib import Path
-
-# Add parent directory to path to import shared module
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from shared.config.settings import settings
 from supabase import Client, create_client
 
@@ -1,10 +1,5 @@
-import sys
-from pathlib import Path
 from uuid import UUID
 
-# Add parent directory to path to import shared module
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from shared.database.models import User
 from sqlalchemy.orm import Session
 
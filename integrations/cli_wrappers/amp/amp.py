@@ -39,13 +39,13 @@ ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 # Terminal patterns for Amp
 PATTERNS = {
-    "thinking_start": r"Thinking\.{3,}",
-    "thinking_end": r"I\s+(need to|will|should|can)",
-    "user_prompt_box": r"╭─+╮.*?╰─+╯",
-    "welcome": r"Welcome to [Aa][Mm][Pp]",
-    "processing": r"Running inference",
-    "error": r"Error:|Failed|Cannot|Unable",
-    "prompt_ready": r"╭─",  # New prompt box appearing
+    "thinking_start": re.compile(r"Thinking\.{3,}"),
+    "thinking_end": re.compile(r"I\s+(need to|will|should|can)"),
+    "user_prompt_box": re.compile(r"╭─+╮.*?╰─+╯"),
+    "welcome": re.compile(r"Welcome to [Aa][Mm][Pp]"),
+    "processing": re.compile(r"Running inference"),
+    "error": re.compile(r"Error:|Failed|Cannot|Unable"),
+    "prompt_ready": re.compile(r"╭─"),  # New prompt box appearing
 }
 
 
@@ -545,8 +545,8 @@ class AmpWrapper:
             # Check if we're in a git repo
             result = subprocess.run(
                 ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=2,
             )
 
@@ -755,7 +755,7 @@ class AmpWrapper:
         try:
             if self.master_fd is None:
                 return False
-            data = os.read(self.master_fd, 4096)
+            data = os.read(self.master_fd, 65536)
             self.log(f"[DEBUG] Read {len(data) if data else 0} bytes from master_fd")
 
             if not data:
@@ -812,7 +812,7 @@ class AmpWrapper:
 
     def _check_amp_ready(self, output: str) -> None:
         """Check if Amp shows ready/welcome message"""
-        if not self.amp_ready and re.search(PATTERNS["welcome"], output):
+        if not self.amp_ready and PATTERNS["welcome"].search(output):
             self.amp_ready = True
             self.log("[INFO] Amp is ready")
 
@@ -1247,7 +1247,7 @@ class AmpWrapper:
                 # Handle stdin (user typing)
                 if sys.stdin in rlist:
                     try:
-                        data = os.read(sys.stdin.fileno(), 1024)
+                        data = os.read(sys.stdin.fileno(), 65536)
                         if data:
                             # Pass through to Amp
                             os.write(self.master_fd, data)
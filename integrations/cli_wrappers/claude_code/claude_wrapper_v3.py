@@ -39,6 +39,17 @@ from integrations.cli_wrappers.claude_code.session_reset_handler import (
 CLAUDE_LOG_BASE = Path.home() / ".claude" / "projects"
 OMNARA_WRAPPER_LOG_DIR = Path.home() / ".omnara" / "claude_wrapper"
 
+# ANSI escape patterns used while scanning PTY output and stdin on every loop tick
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]")
+ANSI_COLOR = re.compile(r"\x1b\[[0-9;]*m")
+ANSI_COLOR_CODES = re.compile(r"\x1b\[[^m]*m")
+ANSI_SINGLE_CHAR_ESCAPE = re.compile(r"\x1b[>=\[\]OPI]")
+ANSI_CHARSET_SELECT = re.compile(r"\x1b\([AB012]")
+ANSI_OSC = re.compile(r"\x1b\].*?\x07")
+
+# Control characters (including NUL) that break the API; newlines and tabs are kept
+CONTROL_CHARS_TABLE = dict.fromkeys(c for c in range(32) if chr(c) not in "\n\r\t")
+
 
 class MessageProcessor:
     """Message processing implementation"""
@@ -89,19 +100,13 @@ class MessageProcessor:
 
             # Sanitize content - remove NUL characters and control characters that break the API
             # This handles binary content from .docx, PDFs, etc.
-            sanitized_content = "".join(
-                char if ord(char) >= 32 or char in "\n\r\t" else ""
-                for char in content.replace("\x00", "")
-            )
+            sanitized_content = content.translate(CONTROL_CHARS_TABLE)
 
             # Get git diff if enabled
             git_diff = self.wrapper.get_git_diff()
             # Sanitize git diff as well if present (handles binary files in git diff)
             if git_diff:
-                git_diff = "".join(
-                    char if ord(char) >= 32 or char in "\n\r\t" else ""
-                    for char in git_diff.replace("\x00", "")
-                )
+                git_diff = git_diff.translate(CONTROL_CHARS_TABLE)
 
             # Send to Omnara
             response = self.wrapper.omnara_client_sync.send_message(
@@ -1364,9 +1369,7 @@ class ClaudeWrapperV3:
                     elif time.time() - self._permission_assumed_time > 0.25:
                         # Clean the buffer to check for content
 
-                        clean_buffer = re.sub(
-                            r"\x1b\[[0-9;]*[a-zA-Z]", "", self.terminal_buffer
-                        )
+                        clean_buffer = ANSI_ESCAPE.sub("", self.terminal_buffer)
 
                         # If we see permission/plan prompt, extract it
                         # For plan mode: "Would you like to proceed" without "(esc"
@@ -1471,7 +1474,7 @@ class ClaudeWrapperV3:
                                     ]
 
                                 # Check for the indicator
-                                clean_text = re.sub(r"\x1b\[[0-9;]*m", "", text)
+                                clean_text = ANSI_COLOR.sub("", text)
 
                                 # Check for both "esc to interrupt" and "ctrl+b to run in background"
                                 if (
@@ -1537,20 +1540,20 @@ class ClaudeWrapperV3:
 
                                         # Clean the line - remove escape sequences and get just the text
                                         # Remove various ANSI escape sequences
-                                        clean_line = re.sub(
-                                            r"\x1b\[[^m]*m", "", line
+                                        clean_line = ANSI_COLOR_CODES.sub(
+                                            "", line
                                         )  # Color codes
-                                        clean_line = re.sub(
-                                            r"\x1b\[[0-9;]*[A-Za-z]", "", clean_line
+                                        clean_line = ANSI_ESCAPE.sub(
+                                            "", clean_line
                                         )  # Cursor movement
-                                        clean_line = re.sub(
-                                            r"\x1b[>=\[\]OPI]", "", clean_line
+                                        clean_line = ANSI_SINGLE_CHAR_ESCAPE.sub(
+                                            "", clean_line
                                         )  # Various single char escapes
-                                        clean_line = re.sub(
-                                            r"\x1b\([AB012]", "", clean_line
+                                        clean_line = ANSI_CHARSET_SELECT.sub(
+                                            "", clean_line
                                         )  # Character set selection
-                                        clean_line = re.sub(
-                                            r"\x1b\].*?\x07", "", clean_line
+                                        clean_line = ANSI_OSC.sub(
+                                            "", clean_line
                                         )  # OSC sequences
                                         # Remove all remaining control characters except spaces
                                         clean_line = "".join(
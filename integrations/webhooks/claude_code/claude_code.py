@@ -2,6 +2,7 @@ from fastapi import FastAPI, HTTPException, Header, Request
 from fastapi.responses import JSONResponse
 import subprocess
 import shlex
+import shutil
 from datetime import datetime
 import secrets
 import os
@@ -70,10 +71,10 @@ def get_command_path(command: str) -> Optional[str]:
 def check_command(command: str) -> Tuple[bool, Optional[str]]:
     """Check if a command exists and return its path"""
     try:
-        # First try without shell (more secure, finds actual executables)
-        result = subprocess.run(["which", command], capture_output=True, text=True)
-        if result.returncode == 0:
-            return True, result.stdout.strip()
+        # First walk PATH in-process (no subprocess, finds actual executables)
+        path = shutil.which(command)
+        if path:
+            return True, path
 
         # If that fails, try with shell to catch aliases (less secure but necessary for aliases)
         shell_result = subprocess.run(
@@ -182,7 +183,10 @@ def is_git_repository(path: str = ".") -> bool:
         return False
 
     result = subprocess.run(
-        [git_path, "rev-parse", "--git-dir"], capture_output=True, text=True, cwd=path
+        [git_path, "rev-parse", "--git-dir"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=path,
     )
     return result.returncode == 0
 
@@ -261,14 +265,26 @@ def validate_environment() -> List[str]:
 
 
 # === CLOUDFLARE TUNNEL MANAGEMENT ===
-def check_cloudflared_installed() -> bool:
-    """Check if cloudflared is available"""
+def check_cloudflared_installed(deep: bool = False) -> bool:
+    """Check if cloudflared is available
+
+    By default this only checks that the resolved binary is an executable file.
+    Pass deep=True to also run `cloudflared --version`.
+    """
     cloudflared_path = get_command_path("cloudflared")
     if not cloudflared_path:
         return False
 
+    if not deep:
+        return os.path.isfile(cloudflared_path) and os.access(cloudflared_path, os.X_OK)
+
     try:
-        subprocess.run([cloudflared_path, "--version"], capture_output=True, check=True)
+        subprocess.run(
+            [cloudflared_path, "--version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
@@ -410,6 +426,36 @@ class WebhookRequest(BaseModel):
         return v
 
 
+# === STARTUP BANNER ===
+CONFIG_BOX_WIDTH = 90
+
+
+def _config_box_row(text: str = "") -> str:
+    """Left-align text inside one row of the startup configuration box"""
+    return "║" + text + " " * (CONFIG_BOX_WIDTH - len(text)) + "║"
+
+
+def _config_box_centered_row(text: str) -> str:
+    """Center text inside one row of the startup configuration box"""
+    return _config_box_row(" " * ((CONFIG_BOX_WIDTH - len(text)) // 2) + text)
+
+
+# Static parts of the box are built once at import time
+CONFIG_BOX_BLANK_ROW = _config_box_row()
+CONFIG_BOX_TOP = "\n".join(
+    [
+        "\n╔" + "═" * CONFIG_BOX_WIDTH + "╗",
+        CONFIG_BOX_BLANK_ROW,
+        _config_box_centered_row("AGENT CONFIGURATION"),
+        _config_box_centered_row("(paste this information into Omnara)"),
+        CONFIG_BOX_BLANK_ROW,
+    ]
+)
+CONFIG_BOX_BOTTOM = "\n".join(
+    [CONFIG_BOX_BLANK_ROW, "╚" + "═" * CONFIG_BOX_WIDTH + "╝"]
+)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Run startup checks
@@ -457,50 +503,25 @@ async def lifespan(app: FastAPI):
     if not hasattr(app.state, "dangerously_skip_permissions"):
         app.state.dangerously_skip_permissions = False
 
-    # Display webhook info in a prominent box
-    box_width = 90
-    print("\n" + "╔" + "═" * box_width + "╗")
-    print("║" + " " * box_width + "║")
-
-    # Format the header
-    header = "AGENT CONFIGURATION"
-    header_padding = (box_width - len(header)) // 2
-    print(
-        "║"
-        + " " * header_padding
-        + header
-        + " " * (box_width - header_padding - len(header))
-        + "║"
-    )
-
-    # Add instruction text
-    instruction = "(paste this information into Omnara)"
-    instruction_padding = (box_width - len(instruction)) // 2
-    print(
-        "║"
-        + " " * instruction_padding
-        + instruction
-        + " " * (box_width - instruction_padding - len(instruction))
-        + "║"
-    )
-    print("║" + " " * box_width + "║")
+    # Display webhook info in a prominent box, emitted as a single write so it
+    # doesn't interleave with tunnel or server output
+    box_lines = [CONFIG_BOX_TOP]
 
     # Display tunnel URL first if available
     if tunnel_url:
-        url_line = f"  Webhook URL: {tunnel_url}"
-        print("║" + url_line + " " * (box_width - len(url_line)) + "║")
-        print("║" + " " * box_width + "║")
+        box_lines.append(_config_box_row(f"  Webhook URL: {tunnel_url}"))
+        box_lines.append(CONFIG_BOX_BLANK_ROW)
     elif hasattr(app.state, "cloudflare_tunnel") and app.state.cloudflare_tunnel:
-        cf_line = "  Webhook URL: (waiting for cloudflared to provide URL...)"
-        print("║" + cf_line + " " * (box_width - len(cf_line)) + "║")
-        print("║" + " " * box_width + "║")
-
-    # Format the API key line with proper padding
-    api_key_line = f"  API Key: {secret}"
-    print("║" + api_key_line + " " * (box_width - len(api_key_line)) + "║")
+        box_lines.append(
+            _config_box_row(
+                "  Webhook URL: (waiting for cloudflared to provide URL...)"
+            )
+        )
+        box_lines.append(CONFIG_BOX_BLANK_ROW)
 
-    print("║" + " " * box_width + "║")
-    print("╚" + "═" * box_width + "╝")
+    box_lines.append(_config_box_row(f"  API Key: {secret}"))
+    box_lines.append(CONFIG_BOX_BOTTOM)
+    print("\n".join(box_lines))
 
     if app.state.dangerously_skip_permissions:
         print("\n[WARNING] Running with --dangerously-skip-permissions flag enabled!")
@@ -618,7 +639,7 @@ def verify_auth(request: Request, authorization: str = Header(None)) -> bool:
 
 
 @app.post("/")
-async def start_claude(
+def start_claude(
     request: Request,
     webhook_data: WebhookRequest,
     authorization: str = Header(None),
@@ -925,7 +946,7 @@ async def start_claude(
         if DEBUG_MODE:
             print("\n[DEBUG] Resolving claude command path")
 
-        _, claude_path = check_command("claude")
+        claude_path = get_command_path("claude")
 
         if DEBUG_MODE:
             print(f"  - Claude path: {claude_path if claude_path else 'Not found'}")
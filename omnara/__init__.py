@@ -5,9 +5,10 @@ This package provides:
 2. Python SDK for interacting with the Omnara API
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 # Import SDK components for easy access
-from .sdk.client import OmnaraClient
-from .sdk.async_client import AsyncOmnaraClient
 from .sdk.exceptions import (
     OmnaraError,
     AuthenticationError,
@@ -15,17 +16,41 @@ from .sdk.exceptions import (
     APIError,
 )
 
+if TYPE_CHECKING:
+    from .sdk.client import OmnaraClient
+    from .sdk.async_client import AsyncOmnaraClient
+
+# Clients are imported on first access (PEP 562) so that importing the package,
+# e.g. for the CLI entry point, does not pull in requests/aiohttp up front
+_LAZY_IMPORTS = {
+    "OmnaraClient": ".sdk.client",
+    "AsyncOmnaraClient": ".sdk.async_client",
+}
+
 try:
     from importlib.metadata import version
 
     __version__ = version("omnara")
 except Exception:
     __version__ = "unknown"
-__all__ = [
+__all__ = (
     "OmnaraClient",
     "AsyncOmnaraClient",
     "OmnaraError",
     "AuthenticationError",
     "TimeoutError",
     "APIError",
-]
+)
+
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
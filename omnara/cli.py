@@ -25,6 +25,23 @@ import secrets
 import requests
 import time
 import threading
+from types import MappingProxyType
+
+# Agent configuration mapping (read-only)
+AGENT_CONFIGS = MappingProxyType(
+    {
+        "claude": {
+            "module": "integrations.cli_wrappers.claude_code.claude_wrapper_v3",
+            "function": "main",
+            "argv_name": "claude_wrapper_v3",
+        },
+        "amp": {
+            "module": "integrations.cli_wrappers.amp.amp",
+            "function": "main",
+            "argv_name": "amp_wrapper",
+        },
+    }
+)
 
 
 def get_current_version():
@@ -287,7 +304,8 @@ def authenticate_via_browser(auth_url="https://omnara.com"):
     # Construct the auth URL
     auth_base = auth_url.rstrip("/")
     callback_url = f"http://localhost:{port}"
-    auth_url = f"{auth_base}/cli-auth?callback={urllib.parse.quote(callback_url)}&state={urllib.parse.quote(state)}"
+    query = urllib.parse.urlencode({"callback": callback_url, "state": state})
+    auth_url = f"{auth_base}/cli-auth?{query}"
 
     print("\nOpening browser for authentication...")
     print("If your browser doesn't open automatically, please click this link:")
@@ -331,11 +349,20 @@ def authenticate_via_browser(auth_url="https://omnara.com"):
 
 
 def ensure_api_key(args):
-    """Ensure API key is available, authenticate if needed"""
+    """Ensure API key is available, authenticate if needed
+
+    Lookup order: --api-key argument, OMNARA_API_KEY environment variable,
+    stored credentials file, then browser authentication.
+    """
     # Check if API key is provided via argument
     if hasattr(args, "api_key") and args.api_key:
         return args.api_key
 
+    # Check the environment before touching disk (common for CI/headless use)
+    api_key = os.environ.get("OMNARA_API_KEY")
+    if api_key:
+        return api_key
+
     # Try to load from storage
     api_key = load_stored_api_key()
     if api_key:
@@ -359,22 +386,6 @@ def run_agent_chat(args, unknown_args):
 
     # Import and run directly instead of subprocess
 
-    # Prepare sys.argv for the claude wrapper
-
-    # Agent configuration mapping
-    AGENT_CONFIGS = {
-        "claude": {
-            "module": "integrations.cli_wrappers.claude_code.claude_wrapper_v3",
-            "function": "main",
-            "argv_name": "claude_wrapper_v3",
-        },
-        "amp": {
-            "module": "integrations.cli_wrappers.amp.amp",
-            "function": "main",
-            "argv_name": "amp_wrapper",
-        },
-    }
-
     # Get agent configuration
     agent = getattr(args, "agent", "claude").lower()
     config = AGENT_CONFIGS.get(agent)
@@ -487,7 +498,8 @@ def add_global_arguments(parser):
         "--version", action="store_true", help="Show version information"
     )
     parser.add_argument(
-        "--api-key", help="API key for authentication (uses stored key if not provided)"
+        "--api-key",
+        help="API key for authentication (uses OMNARA_API_KEY or stored key if not provided)",
     )
     parser.add_argument(
         "--base-url",
@@ -501,7 +513,7 @@ def add_global_arguments(parser):
     )
     parser.add_argument(
         "--agent",
-        choices=["claude", "amp"],
+        choices=list(AGENT_CONFIGS),
         default="claude",
         help="Which AI agent to use (default: claude)",
     )
@@ -1,14 +1,39 @@
 """Omnara Python SDK for interacting with the Agent Dashboard API."""
 
-from .client import OmnaraClient
-from .async_client import AsyncOmnaraClient
+import importlib
+from typing import TYPE_CHECKING
+
 from .exceptions import OmnaraError, AuthenticationError, TimeoutError, APIError
 
-__all__ = [
+if TYPE_CHECKING:
+    from .client import OmnaraClient
+    from .async_client import AsyncOmnaraClient
+
+# Clients are imported on first access (PEP 562) so that importing one of them,
+# or just the exceptions, does not also load the other HTTP stack
+_LAZY_IMPORTS = {
+    "OmnaraClient": ".client",
+    "AsyncOmnaraClient": ".async_client",
+}
+
+__all__ = (
     "OmnaraClient",
     "AsyncOmnaraClient",
     "OmnaraError",
     "AuthenticationError",
     "TimeoutError",
     "APIError",
-]
+)
+
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -1,6 +1,7 @@
 """Async client for interacting with the Omnara Agent Dashboard API."""
 
 import asyncio
+import functools
 import ssl
 import uuid
 from typing import Optional, Dict, Any, Union, List
@@ -23,6 +24,16 @@ from .utils import (
 )
 
 
+@functools.lru_cache(maxsize=1)
+def _get_ssl_context() -> ssl.SSLContext:
+    """Create the certifi-backed SSL context once and share it across sessions.
+
+    Loading the CA bundle is relatively expensive, and reusing one context also
+    lets TLS sessions be resumed when a client session is recreated.
+    """
+    return ssl.create_default_context(cafile=certifi.where())
+
+
 class AsyncOmnaraClient:
     """Async client for interacting with the Omnara Agent Dashboard API.
 
@@ -61,15 +72,17 @@ class AsyncOmnaraClient:
     async def _ensure_session(self):
         """Ensure aiohttp session exists."""
         if self.session is None or self.session.closed:
-            # Create SSL context using certifi's certificate bundle
+            # Use SSL context built from certifi's certificate bundle
             # This fixes SSL verification issues with aiohttp on some systems
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
+            ssl_context = _get_ssl_context()
 
-            # Configure connector
+            # Configure connector; keep idle connections around longer than the
+            # default 15s so periodic polling reuses them instead of re-handshaking
             connector = aiohttp.TCPConnector(
                 ssl=ssl_context,
                 limit=100,
                 ttl_dns_cache=300,
+                keepalive_timeout=60,
             )
 
             self.session = aiohttp.ClientSession(
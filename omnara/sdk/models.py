@@ -1,20 +1,21 @@
 """Data models for the Omnara SDK."""
 
-from typing import List
+from __future__ import annotations
+
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class LogStepResponse:
     """Response from logging a step."""
 
     success: bool
     agent_instance_id: str
     step_number: int
-    user_feedback: List[str]
+    user_feedback: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class EndSessionResponse:
     """Response from ending a session."""
 
@@ -23,17 +24,17 @@ class EndSessionResponse:
     final_status: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateMessageResponse:
     """Response from creating a message."""
 
     success: bool
     agent_instance_id: str
     message_id: str
-    queued_user_messages: List[str]
+    queued_user_messages: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A message in the conversation."""
 
@@ -44,10 +45,10 @@ class Message:
     requires_user_input: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingMessagesResponse:
     """Response from getting pending messages."""
 
     agent_instance_id: str
-    messages: List[Message]
+    messages: list[Message]
     status: str  # 'ok' or 'stale'
@@ -3,6 +3,7 @@
 Uses the same JWT authentication as the MCP server.
 """
 
+import time
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
@@ -13,6 +14,12 @@ from shared.config import settings
 # Bearer token security scheme
 security = HTTPBearer()
 
+# Verified token payloads, keyed by raw token: token -> (cache_expires_at, payload).
+# Agents poll with the same API key, so this skips repeated RSA verification.
+_TOKEN_CACHE: dict[str, tuple[float, dict]] = {}
+_TOKEN_CACHE_TTL = 300.0
+_TOKEN_CACHE_MAX_SIZE = 1024
+
 
 async def verify_token(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
@@ -36,10 +43,14 @@ async def verify_token(
 
     token = credentials.credentials
 
+    now = time.time()
+    cached = _TOKEN_CACHE.get(token)
+    if cached and cached[0] > now:
+        return cached[1]
+
     try:
         # Decode and verify the JWT token
         payload = jwt.decode(token, settings.jwt_public_key, algorithms=["RS256"])
-        return payload
     except JWTError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -47,6 +58,17 @@ async def verify_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Never cache a payload past the token's own expiry
+    expires_at = now + _TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, float(exp))
+
+    if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX_SIZE:
+        _TOKEN_CACHE.clear()
+    _TOKEN_CACHE[token] = (expires_at, payload)
+    return payload
+
 
 async def get_current_user_id(
     token_payload: Annotated[dict, Depends(verify_token)],
@@ -208,8 +208,8 @@ async def log_step_tool(
     agent_type = detect_agent_type_from_environment()
     client = get_client()
 
-    # Get git diff if enabled
-    git_diff = get_git_diff()
+    # Get git diff if enabled (runs git in a worker thread off the event loop)
+    git_diff = await asyncio.to_thread(get_git_diff)
 
     response = await client.send_message(
         agent_type=agent_type,
@@ -249,8 +249,8 @@ async def ask_question_tool(
     agent_type = detect_agent_type_from_environment()
     client = get_client()
 
-    # Get git diff if enabled
-    git_diff = get_git_diff()
+    # Get git diff if enabled (runs git in a worker thread off the event loop)
+    git_diff = await asyncio.to_thread(get_git_diff)
 
     if current_agent_instance_id is None:
         current_agent_instance_id = agent_instance_id